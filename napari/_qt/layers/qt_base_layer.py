@@ -1,4 +1,4 @@
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtGui import QImage, QPixmap
 from qtpy.QtWidgets import (
     QSlider,
@@ -36,6 +36,14 @@ class QtLayerProperties(QFrame):
         layer.events.visible.connect(self._on_visible_change)
         layer.events.thumbnail.connect(self._on_thumbnail_change)
 
+        # Coalesce bursts of thumbnail events (e.g. during paint drags)
+        # into a single pixmap rebuild per timer tick; the thumbnail is
+        # only visible at display refresh rate anyway.
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(33)
+        self._thumbnail_timer.timeout.connect(self._update_thumbnail_pixmap)
+
         self.setObjectName('layer')
 
         self.vbox_layout = QVBoxLayout()
@@ -70,7 +78,7 @@ class QtLayerProperties(QFrame):
         tb.setObjectName('thumbmnail')
         tb.setToolTip('Layer thumbmnail')
         self.thumbnail_label = tb
-        self._on_thumbnail_change(None)
+        self._update_thumbnail_pixmap()
         self.top_layout.addWidget(tb)
 
         textbox = QLineEdit(self)
@@ -202,6 +210,10 @@ class QtLayerProperties(QFrame):
             self.visibleCheckBox.setChecked(self.layer.visible)
 
     def _on_thumbnail_change(self, event):
+        if not self._thumbnail_timer.isActive():
+            self._thumbnail_timer.start()
+
+    def _update_thumbnail_pixmap(self):
         thumbnail = self.layer.thumbnail
         # Note that QImage expects the image width followed by height
         image = QImage(
@@ -17,9 +17,19 @@ from qtpy.QtWidgets import (
     QAction,
     QShortcut,
 )
+from string import Template
+
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtGui import QKeySequence
 
-from ..util.theme import template
+# Stylesheet template is constant; substituting palette values into a
+# precompiled template avoids re-parsing the template string on every
+# palette event. A single stylesheet on the main window is cheaper for
+# Qt to resolve than separate per-widget stylesheets.
+_WINDOW_STYLE = Template(
+    'QStatusBar { background: $background; color: $text; } '
+    'QWidget#qt_center { background: $background; }'
+)
 
 
 class Window:
@@ -43,6 +53,7 @@ class Window:
         self._qt_window = QMainWindow()
         self._qt_window.setUnifiedTitleAndToolBarOnMac(True)
         self._qt_center = QWidget()
+        self._qt_center.setObjectName('qt_center')
         self._qt_window.setCentralWidget(self._qt_center)
         self._qt_window.setWindowTitle(self.qt_viewer.viewer.title)
         self._qt_center.setLayout(QHBoxLayout())
@@ -50,6 +61,20 @@ class Window:
         self._qt_window.closeEvent = self.closeEvent
         self.close = self._qt_window.close
 
+        self._palette_dirty = False
+        self._pending_palette = None
+        self._initial_size_hint = None
+
+        # Status and help events can fire at the input event rate during
+        # mouse moves; coalesce them onto a ~60 Hz timer so the status bar
+        # repaints at most once per tick with the latest text.
+        self._status_pending = None
+        self._help_pending = None
+        self._status_timer = QTimer()
+        self._status_timer.setInterval(16)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+
         self._add_menubar()
 
         self._add_file_menu()
@@ -58,6 +83,12 @@ class Window:
 
         self._status_bar.showMessage('Ready')
         self._help = QLabel('')
+        # The label only ever shows plain status text, so skip rich-text
+        # interpretation and mouse handling on every update.
+        self._help.setTextFormat(Qt.PlainText)
+        self._help.setTextInteractionFlags(Qt.NoTextInteraction)
+        self._help.setMouseTracking(False)
+        self._status_bar.setMouseTracking(False)
         self._status_bar.addPermanentWidget(self._help)
 
         self._qt_center.layout().addWidget(self.qt_viewer)
@@ -69,7 +100,7 @@ class Window:
         self.qt_viewer.viewer.events.help.connect(self._help_changed)
         self.qt_viewer.viewer.events.title.connect(self._title_changed)
         self.qt_viewer.viewer.events.palette.connect(
-            lambda event: self._update_palette(event.palette)
+            self._schedule_palette_update
         )
 
         if show:
@@ -77,56 +108,70 @@ class Window:
 
     def _add_menubar(self):
         self.main_menu = self._qt_window.menuBar()
-        # Menubar shortcuts are only active when the menubar is visible.
-        # Therefore, we set a global shortcut not associated with the menubar
-        # to toggle visibility, *but*, in order to not shadow the menubar
-        # shortcut, we disable it, and only enable it when the menubar is
-        # hidden. See this stackoverflow link for details:
-        # https://stackoverflow.com/questions/50537642/how-to-keep-the-shortcuts-of-a-hidden-widget-in-pyqt5
+        # Menu actions are created lazily on first open, so the shortcuts
+        # they would otherwise provide are installed globally here to keep
+        # them live from startup. With no shortcut left on the menu action,
+        # the Ctrl+M toggle can stay enabled regardless of whether the
+        # menubar is visible.
         self._main_menu_shortcut = QShortcut(
             QKeySequence('Ctrl+M'), self._qt_window
         )
         self._main_menu_shortcut.activated.connect(
             self._toggle_menubar_visible
         )
-        self._main_menu_shortcut.setEnabled(False)
+        self._open_shortcut = QShortcut(
+            QKeySequence('Ctrl+O'), self._qt_window
+        )
+        self._open_shortcut.activated.connect(self.qt_viewer._open_images)
+        self._close_shortcut = QShortcut(
+            QKeySequence('Ctrl+W'), self._qt_window
+        )
+        self._close_shortcut.activated.connect(self._qt_window.close)
 
     def _toggle_menubar_visible(self):
-        """Toggle visibility of app menubar.
-
-        This function also disables or enables a global keyboard shortcut to
-        show the menubar, since menubar shortcuts are only available while the
-        menubar is visible.
-        """
-        if self.main_menu.isVisible():
-            self.main_menu.setVisible(False)
-            self._main_menu_shortcut.setEnabled(True)
-        else:
-            self.main_menu.setVisible(True)
-            self._main_menu_shortcut.setEnabled(False)
+        """Toggle visibility of app menubar."""
+        self.main_menu.setVisible(not self.main_menu.isVisible())
 
     def _add_file_menu(self):
+        self.file_menu = self.main_menu.addMenu('&File')
+        self._file_menu_populated = False
+        self.file_menu.aboutToShow.connect(self._populate_file_menu)
+
+    def _populate_file_menu(self):
+        if self._file_menu_populated:
+            return
+        self._file_menu_populated = True
         open_images = QAction('Open', self._qt_window)
-        open_images.setShortcut('Ctrl+O')
         open_images.setStatusTip('Open image file(s)')
         open_images.triggered.connect(self.qt_viewer._open_images)
-        self.file_menu = self.main_menu.addMenu('&File')
         self.file_menu.addAction(open_images)
 
     def _add_view_menu(self):
+        self.view_menu = self.main_menu.addMenu('&View')
+        self._view_menu_populated = False
+        self.view_menu.aboutToShow.connect(self._populate_view_menu)
+
+    def _populate_view_menu(self):
+        if self._view_menu_populated:
+            return
+        self._view_menu_populated = True
         toggle_visible = QAction('Toggle menubar visibility', self._qt_window)
-        toggle_visible.setShortcut('Ctrl+M')
         toggle_visible.setStatusTip('Hide Menubar')
         toggle_visible.triggered.connect(self._toggle_menubar_visible)
-        self.view_menu = self.main_menu.addMenu('&View')
         self.view_menu.addAction(toggle_visible)
 
     def _add_window_menu(self):
+        self.window_menu = self.main_menu.addMenu('&Window')
+        self._window_menu_populated = False
+        self.window_menu.aboutToShow.connect(self._populate_window_menu)
+
+    def _populate_window_menu(self):
+        if self._window_menu_populated:
+            return
+        self._window_menu_populated = True
         exit_action = QAction("Close window", self._qt_window)
-        exit_action.setShortcut("Ctrl+W")
         exit_action.setStatusTip('Close napari window')
         exit_action.triggered.connect(self._qt_window.close)
-        self.window_menu = self.main_menu.addMenu('&Window')
         self.window_menu.addAction(exit_action)
 
     def resize(self, width, height):
@@ -144,28 +189,42 @@ class Window:
     def show(self):
         """Resize, show, and bring forward the window.
         """
-        self._qt_window.resize(self._qt_window.layout().sizeHint())
+        # Computing the layout size hint walks the whole widget tree, so
+        # only do it on first show; reshowing keeps the current size.
+        if self._initial_size_hint is None:
+            self._initial_size_hint = self._qt_window.layout().sizeHint()
+            self._qt_window.resize(self._initial_size_hint)
         self._qt_window.show()
         self._qt_window.raise_()
 
+    def _schedule_palette_update(self, event):
+        """Queue a palette update, coalescing bursts of palette events.
+
+        Only the most recent palette is kept and a single stylesheet
+        rebuild is scheduled for the next event-loop turn, so repeated
+        emissions trigger just one Qt stylesheet reparse.
+        """
+        self._pending_palette = event.palette
+        if not self._palette_dirty:
+            self._palette_dirty = True
+            QTimer.singleShot(0, self._apply_pending_palette)
+
+    def _apply_pending_palette(self):
+        """Apply the most recently scheduled palette update."""
+        self._palette_dirty = False
+        self._update_palette(self._pending_palette)
+
     def _update_palette(self, palette):
         # set window styles which don't use the primary stylesheet
         # FIXME: this is a problem with the stylesheet not using properties
-        self._status_bar.setStyleSheet(
-            template(
-                'QStatusBar { background: {{ background }}; '
-                'color: {{ text }}; }',
-                **palette,
-            )
-        )
-        self._qt_center.setStyleSheet(
-            template('QWidget { background: {{ background }}; }', **palette)
-        )
+        self._qt_window.setStyleSheet(_WINDOW_STYLE.substitute(palette))
 
     def _status_changed(self, event):
         """Update status bar.
         """
-        self._status_bar.showMessage(event.text)
+        self._status_pending = event.text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
     def _title_changed(self, event):
         """Update window title.
@@ -175,7 +234,18 @@ class Window:
     def _help_changed(self, event):
         """Update help message on status bar.
         """
-        self._help.setText(event.text)
+        self._help_pending = event.text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Apply the latest pending status and help texts."""
+        if self._status_pending is not None:
+            self._status_bar.showMessage(self._status_pending)
+            self._status_pending = None
+        if self._help_pending is not None:
+            self._help.setText(self._help_pending)
+            self._help_pending = None
 
     def closeEvent(self, event):
         # Forward close event to the console to trigger proper shutdown
@@ -130,15 +130,11 @@ class QtViewer(QSplitter):
         self.viewer.events.interactive.connect(self._on_interactive)
         self.viewer.events.cursor.connect(self._on_cursor)
         self.viewer.events.reset_view.connect(self._on_reset_view)
-        self.viewer.events.palette.connect(
-            lambda event: self._update_palette(event.palette)
-        )
+        self.viewer.events.palette.connect(self._on_palette)
         self.viewer.layers.events.reordered.connect(self._reorder_layers)
         self.viewer.layers.events.added.connect(self._add_layer)
         self.viewer.layers.events.removed.connect(self._remove_layer)
-        self.viewer.dims.events.camera.connect(
-            lambda event: self._update_camera()
-        )
+        self.viewer.dims.events.camera.connect(self._on_camera)
 
         self.setAcceptDrops(True)
 
@@ -168,6 +164,14 @@ class QtViewer(QSplitter):
         self.canvas._draw_order.clear()
         self.canvas.update()
 
+    def _on_palette(self, event):
+        """Update the palette without an intermediate lambda frame."""
+        self._update_palette(event.palette)
+
+    def _on_camera(self, event):
+        """Update the camera without an intermediate lambda frame."""
+        self._update_camera()
+
     def _update_camera(self):
         if self.viewer.dims.ndisplay == 3:
             # Set a 3D camera
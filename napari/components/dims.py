@@ -72,6 +72,8 @@ class Dims:
         self._interval = []
         self._mode = []
         self._order = []
+        self._order_arr = None
+        self._displayed_order_cache = None
         self.clip = True
 
         self._ndisplay = 2
@@ -127,9 +129,22 @@ class Dims:
         if np.all(self._order == order):
             return
         self._order = order
+        self._order_arr = None
+        self._displayed_order_cache = None
         self.events.order()
         self.events.camera()
 
+    @property
+    def _order_array(self):
+        """np.ndarray: Cached array of the display order.
+
+        Invalidated whenever `order` changes, so repeated consumers avoid
+        rebuilding an array from the order list on every event.
+        """
+        if self._order_arr is None:
+            self._order_arr = np.asarray(self._order, dtype=int)
+        return self._order_arr
+
     @property
     def ndim(self):
         """Returns the number of dimensions
@@ -158,6 +173,8 @@ class Dims:
                 self._interval.insert(0, (0, 1))
                 self._mode.insert(0, DimsMode.POINT)
                 self._order = [0] + list(np.add(self.order, 1))
+                self._order_arr = None
+                self._displayed_order_cache = None
 
             # Notify listeners that the number of dimensions have changed
             self.events.ndim()
@@ -173,6 +190,8 @@ class Dims:
             order = np.array(self._order[-ndim:])
             order[np.argsort(order)] = list(range(len(order)))
             self._order = list(order)
+            self._order_arr = None
+            self._displayed_order_cache = None
 
             # Notify listeners that the number of dimensions have changed
             self.events.ndim()
@@ -213,6 +232,7 @@ class Dims:
             )
 
         self._ndisplay = ndisplay
+        self._displayed_order_cache = None
         self.events.ndisplay()
         self.events.camera()
 
@@ -228,10 +248,16 @@ class Dims:
 
     @property
     def displayed_order(self):
-        """Tuple: Order of only displayed dimensions."""
-        order = np.array(self.displayed)
-        order[np.argsort(order)] = list(range(len(order)))
-        return tuple(order)
+        """Tuple: Order of only displayed dimensions.
+
+        Cached until `order`, `ndim`, or `ndisplay` changes, as it is
+        recomputed on every slice update otherwise.
+        """
+        if self._displayed_order_cache is None:
+            order = np.array(self.displayed)
+            order[np.argsort(order)] = list(range(len(order)))
+            self._displayed_order_cache = tuple(order)
+        return self._displayed_order_cache
 
     def set_range(self, axis: int, range: Sequence[Union[int, float]]):
         """Sets the range (min, max, step) for a given axis (dimension)
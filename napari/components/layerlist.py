@@ -29,7 +29,66 @@ class LayerList(ListModel):
             basetype=Layer, lookup={str: lambda q, e: q == e.name}
         )
 
+        # Incrementally maintained set of the currently selected layers so
+        # consumers do not have to rescan the whole list on every event.
+        self._selected_set = set()
+
         self.events.added.connect(_add)
+        self.events.added.connect(self._track_selection)
+        self.events.removed.connect(self._untrack_selection)
+
+    def _track_selection(self, event):
+        """When a layer is added, track its selection state."""
+        layer = event.item
+        layer.events.select.connect(self._on_layer_select)
+        layer.events.deselect.connect(self._on_layer_deselect)
+        if layer.selected:
+            self._selected_set.add(layer)
+
+    def _untrack_selection(self, event):
+        """When a layer is removed, stop tracking its selection state."""
+        layer = event.item
+        layer.events.select.disconnect(self._on_layer_select)
+        layer.events.deselect.disconnect(self._on_layer_deselect)
+        self._selected_set.discard(layer)
+
+    def _on_layer_select(self, event):
+        self._selected_set.add(event.source)
+
+    def _on_layer_deselect(self, event):
+        self._selected_set.discard(event.source)
+
+    def insert(self, index, object):
+        """Insert a layer at ``index``.
+
+        A born-selected layer is added to the selection set before the
+        ``added`` event fires, so callbacks running on that event already
+        observe it as selected.
+        """
+        if getattr(object, 'selected', False):
+            self._selected_set.add(object)
+        super().insert(index, object)
+
+    def append(self, object):
+        """Append a layer.
+
+        A born-selected layer is added to the selection set before the
+        ``added`` event fires, so callbacks running on that event already
+        observe it as selected.
+        """
+        if getattr(object, 'selected', False):
+            self._selected_set.add(object)
+        super().append(object)
+
+    def pop(self, key):
+        """Remove and return the layer referenced by ``key``.
+
+        The layer is dropped from the selection set before the ``removed``
+        event fires, so callbacks running on that event never observe the
+        removed layer as still selected.
+        """
+        self._selected_set.discard(self[key])
+        return super().pop(key)
 
     def __newlike__(self, iterable):
         return ListModel(self._basetype, iterable, self._lookup)
@@ -1,14 +1,31 @@
 import numpy as np
+from collections import namedtuple
 from math import inf
-from itertools import zip_longest
-from xml.etree.ElementTree import Element, tostring
+from sys import intern
+from itertools import chain
+from xml.etree.ElementTree import Element, ElementTree, tostring
 from .dims import Dims
 from .layerlist import LayerList
 from .. import layers
+from ..util._register import create_func
 from ..util.event import EmitterGroup, Event
 from ..util.keybindings import KeymapMixin
 from ..util.theme import palettes
 
+# interned so the setters' equality guards hit the pointer-comparison
+# fast path when these defaults are re-assigned
+_READY = intern('Ready')
+_STANDARD_CURSOR = intern('standard')
+
+# tuple subclass, so consumers that expect a plain 4-tuple keep working
+ViewBox = namedtuple('ViewBox', ('x', 'y', 'width', 'height'))
+
+_SVG_PROLOG = (
+    '<?xml version="1.0" standalone="no"?>\n'
+    '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"\n'
+    '"http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">\n'
+)
+
 
 class ViewerModel(KeymapMixin):
     """Viewer containing the rendered scene, layers, and controlling elements
@@ -39,6 +56,52 @@ class ViewerModel(KeymapMixin):
 
     themes = palettes
 
+    # Reverse map from palette identity to theme name so the theme getter
+    # does not have to compare every palette dict on each access.
+    _palette_to_theme = {id(p): name for name, p in palettes.items()}
+
+    # Table of (event name, handler name) pairs connected for every layer
+    # added, avoiding a chain of attribute lookups per connection.
+    _LAYER_EVENT_HOOKS = (
+        ('select', '_update_active_layer'),
+        ('deselect', '_update_active_layer'),
+        ('status', '_update_status'),
+        ('help', '_update_help'),
+        ('interactive', '_update_interactive'),
+        ('cursor', '_update_cursor'),
+        ('cursor_size', '_update_cursor_size'),
+        ('data', '_on_layers_change'),
+    )
+    _LAYER_DIMS_EVENT_HOOKS = (
+        ('ndisplay', '_on_layers_change'),
+        ('order', '_on_layers_change'),
+        ('range', '_on_layers_change'),
+    )
+
+    # Slots make the hot attribute accesses in the evented setters direct
+    # offsets instead of dict lookups and drop the per-instance __dict__.
+    # __weakref__ is needed because the event machinery keeps weak
+    # references to the source object. Subclasses without __slots__ (such
+    # as Viewer) still get a __dict__ for their extra attributes.
+    __slots__ = (
+        '__weakref__',
+        '_active_layer',
+        '_bbox_cache',
+        '_cursor',
+        '_cursor_size',
+        '_help',
+        '_interactive',
+        '_layers_update_pending',
+        '_layers_updating',
+        '_palette',
+        '_ranges_cache',
+        '_status',
+        '_title',
+        'dims',
+        'events',
+        'layers',
+    )
+
     def __init__(self, title='napari', ndisplay=2, order=None):
         super().__init__()
 
@@ -67,27 +130,55 @@ class ViewerModel(KeymapMixin):
 
         self.layers = LayerList()
 
-        self._status = 'Ready'
+        self._status = _READY
         self._help = ''
         self._title = title
-        self._cursor = 'standard'
+        self._cursor = _STANDARD_CURSOR
         self._cursor_size = None
         self._interactive = True
         self._active_layer = None
 
         self._palette = None
+        self._bbox_cache = None
+        self._ranges_cache = None
+        self._layers_updating = False
+        self._layers_update_pending = False
         self.theme = 'dark'
 
         self.dims.events.camera.connect(lambda e: self.reset_view())
-        self.dims.events.ndisplay.connect(lambda e: self._update_layers())
-        self.dims.events.order.connect(lambda e: self._update_layers())
-        self.dims.events.axis.connect(lambda e: self._update_layers())
+        self.dims.events.ndisplay.connect(self._schedule_layers_update)
+        self.dims.events.order.connect(self._schedule_layers_update)
+        self.dims.events.axis.connect(self._schedule_layers_update)
         self.layers.events.added.connect(self._on_layers_change)
         self.layers.events.removed.connect(self._on_layers_change)
         self.layers.events.added.connect(self._update_active_layer)
         self.layers.events.removed.connect(self._update_active_layer)
         self.layers.events.reordered.connect(self._update_active_layer)
 
+    def _set_evented(self, attr, value, emitter, **emit_kwargs):
+        """Assign an evented attribute, skipping unchanged values.
+
+        The current value is compared by identity before equality so that
+        re-assigning the same object (a common pattern for palettes and
+        layers) never pays for a full equality check.
+
+        Parameters
+        ----------
+        attr : str
+            Name of the underlying private attribute.
+        value
+            New value to assign.
+        emitter : EventEmitter
+            Emitter to call if the value changed.
+        **emit_kwargs
+            Keyword arguments forwarded to the emitter.
+        """
+        current = getattr(self, attr)
+        if current is value or current == value:
+            return
+        setattr(self, attr, value)
+        emitter(**emit_kwargs)
+
     @property
     def palette(self):
         """dict of str: str : Color palette with which to style the viewer.
@@ -96,22 +187,26 @@ class ViewerModel(KeymapMixin):
 
     @palette.setter
     def palette(self, palette):
-        if palette == self.palette:
-            return
-
-        self._palette = palette
-        self.events.palette(palette=palette)
+        self._set_evented(
+            '_palette', palette, self.events.palette, palette=palette
+        )
 
     @property
     def theme(self):
         """string or None : Preset color palette.
         """
+        theme = self._palette_to_theme.get(id(self._palette))
+        if theme is not None:
+            return theme
+        # fall back to equality in case an equivalent palette dict was set
         for theme, palette in self.themes.items():
             if palette == self.palette:
                 return theme
 
     @theme.setter
     def theme(self, theme):
+        if self.themes.get(theme) is self._palette:
+            return
         if theme == self.theme:
             return
 
@@ -131,10 +226,7 @@ class ViewerModel(KeymapMixin):
 
     @status.setter
     def status(self, status):
-        if status == self.status:
-            return
-        self._status = status
-        self.events.status(text=self._status)
+        self._set_evented('_status', status, self.events.status, text=status)
 
     @property
     def help(self):
@@ -145,10 +237,7 @@ class ViewerModel(KeymapMixin):
 
     @help.setter
     def help(self, help):
-        if help == self.help:
-            return
-        self._help = help
-        self.events.help(text=self._help)
+        self._set_evented('_help', help, self.events.help, text=help)
 
     @property
     def title(self):
@@ -158,10 +247,7 @@ class ViewerModel(KeymapMixin):
 
     @title.setter
     def title(self, title):
-        if title == self.title:
-            return
-        self._title = title
-        self.events.title(text=self._title)
+        self._set_evented('_title', title, self.events.title, text=title)
 
     @property
     def interactive(self):
@@ -171,10 +257,7 @@ class ViewerModel(KeymapMixin):
 
     @interactive.setter
     def interactive(self, interactive):
-        if interactive == self.interactive:
-            return
-        self._interactive = interactive
-        self.events.interactive()
+        self._set_evented('_interactive', interactive, self.events.interactive)
 
     @property
     def cursor(self):
@@ -184,10 +267,7 @@ class ViewerModel(KeymapMixin):
 
     @cursor.setter
     def cursor(self, cursor):
-        if cursor == self.cursor:
-            return
-        self._cursor = cursor
-        self.events.cursor()
+        self._set_evented('_cursor', cursor, self.events.cursor)
 
     @property
     def cursor_size(self):
@@ -197,10 +277,7 @@ class ViewerModel(KeymapMixin):
 
     @cursor_size.setter
     def cursor_size(self, cursor_size):
-        if cursor_size == self.cursor_size:
-            return
-        self._cursor_size = cursor_size
-        self.events.cursor()
+        self._set_evented('_cursor_size', cursor_size, self.events.cursor)
 
     @property
     def active_layer(self):
@@ -210,10 +287,12 @@ class ViewerModel(KeymapMixin):
 
     @active_layer.setter
     def active_layer(self, active_layer):
-        if active_layer == self.active_layer:
-            return
-        self._active_layer = active_layer
-        self.events.active_layer(item=self._active_layer)
+        self._set_evented(
+            '_active_layer',
+            active_layer,
+            self.events.active_layer,
+            item=active_layer,
+        )
 
     def reset_view(self):
         """Resets the camera's view using `event.viewbox` a 4-tuple of the x, y
@@ -221,22 +300,20 @@ class ViewerModel(KeymapMixin):
         """
         # Scale the camera to the contents in the scene
         min_shape, max_shape = self._calc_bbox()
-        centroid = np.add(min_shape, max_shape) / 2
-        centroid = [centroid[i] for i in self.dims.displayed]
-        size = np.subtract(max_shape, min_shape)
-        size = [size[i] for i in self.dims.displayed]
-        corner = [min_shape[i] for i in self.dims.displayed]
+        displayed = np.fromiter(self.dims.displayed, dtype=np.intp)
+        corner = min_shape[displayed]
+        size = max_shape[displayed] - corner
 
         if self.dims.ndisplay == 2:
             # For a PanZoomCamera emit a 4-tuple of the viewbox
-            corner = np.subtract(corner, np.multiply(0.05, size))[::-1]
-            size = np.multiply(1.1, size)[::-1]
-            rect = tuple(corner) + tuple(size)
-            self.events.reset_view(viewbox=rect)
+            rect = np.empty(4)
+            rect[:2] = (corner - 0.05 * size)[::-1]
+            rect[2:] = 1.1 * size[::-1]
+            self.events.reset_view(viewbox=ViewBox(*rect))
         else:
             # For an ArcballCamera emit the center and scale_factor
-            center = centroid[::-1]
-            scale_factor = 1.5 * np.mean(size)
+            center = (corner + size / 2)[::-1]
+            scale_factor = 1.5 * size.mean()
             self.events.reset_view(center=center, scale_factor=scale_factor)
 
     def to_svg(self, file=None, view_box=None):
@@ -257,15 +334,17 @@ class ViewerModel(KeymapMixin):
 
         Returns
         ----------
-        svg : string
-            SVG representation of the currently viewed layers.
+        svg : string or None
+            SVG representation of the currently viewed layers. Only
+            returned if no file was passed; when writing to a file the
+            SVG is streamed directly to it.
         """
 
         if view_box is None:
             min_shape, max_shape = self._calc_bbox()
             min_shape = min_shape[-2:]
             max_shape = max_shape[-2:]
-            shape = np.subtract(max_shape, min_shape)
+            shape = max_shape - min_shape
         else:
             shape = view_box[2:]
             min_shape = view_box[:2]
@@ -286,24 +365,22 @@ class ViewerModel(KeymapMixin):
         transform = f'translate({-min_shape[1]} {-min_shape[0]})'
         xml_transform = Element('g', transform=transform)
 
-        for layer in self.layers:
-            if layer.visible:
-                xml_list = layer.to_xml_list()
-                for x in xml_list:
-                    xml_transform.append(x)
-        xml.append(xml_transform)
-
-        svg = (
-            '<?xml version=\"1.0\" standalone=\"no\"?>\n'
-            + '<!DOCTYPE svg PUBLIC \"-//W3C//DTD SVG 1.1//EN\"\n'
-            + '\"http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd\">\n'
-            + tostring(xml, encoding='unicode', method='xml')
+        xml_transform.extend(
+            chain.from_iterable(
+                layer.to_xml_list() for layer in self.layers if layer.visible
+            )
         )
+        xml.append(xml_transform)
 
         if file:
-            # Save svg to file
+            # Stream the tree to the file element-by-element instead of
+            # materializing the full SVG string in memory
             with open(file, 'w') as f:
-                f.write(svg)
+                f.write(_SVG_PROLOG)
+                ElementTree(xml).write(f, encoding='unicode', method='xml')
+            return
+
+        svg = _SVG_PROLOG + tostring(xml, encoding='unicode', method='xml')
 
         return svg
 
@@ -315,503 +392,94 @@ class ViewerModel(KeymapMixin):
         layer : Layer
             Layer to add.
         """
-        layer.events.select.connect(self._update_active_layer)
-        layer.events.deselect.connect(self._update_active_layer)
-        layer.events.status.connect(self._update_status)
-        layer.events.help.connect(self._update_help)
-        layer.events.interactive.connect(self._update_interactive)
-        layer.events.cursor.connect(self._update_cursor)
-        layer.events.cursor_size.connect(self._update_cursor_size)
-        layer.events.data.connect(self._on_layers_change)
-        layer.dims.events.ndisplay.connect(self._on_layers_change)
-        layer.dims.events.order.connect(self._on_layers_change)
-        layer.dims.events.range.connect(self._on_layers_change)
+        layer_events = layer.events
+        for name, handler in self._LAYER_EVENT_HOOKS:
+            layer_events[name].connect(getattr(self, handler))
+        dims_events = layer.dims.events
+        for name, handler in self._LAYER_DIMS_EVENT_HOOKS:
+            dims_events[name].connect(getattr(self, handler))
         self.layers.append(layer)
         self._update_layers(layers=[layer])
 
         if len(self.layers) == 1:
             self.reset_view()
 
-    def add_image(
-        self,
-        data,
-        *,
-        multichannel=None,
-        colormap='gray',
-        contrast_limits=None,
-        interpolation='nearest',
-        rendering='mip',
-        name=None,
-        metadata=None,
-        scale=None,
-        translate=None,
-        opacity=1,
-        blending='translucent',
-        visible=True,
-    ):
-        """Add an image layer to the layers list.
-
-        Parameters
-        ----------
-        data : array
-            Image data. Can be N dimensional. If the last dimension has length
-            3 or 4 can be interpreted as RGB or RGBA if multichannel is `True`.
-        multichannel : bool
-            Whether the image is multichannel RGB or RGBA if multichannel. If
-            not specified by user and the last dimension of the data has length
-            3 or 4 it will be set as `True`. If `False` the image is
-            interpreted as a luminance image.
-        colormap : str, vispy.Color.Colormap, tuple, dict
-            Colormap to use for luminance images. If a string must be the name
-            of a supported colormap from vispy or matplotlib. If a tuple the
-            first value must be a string to assign as a name to a colormap and
-            the second item must be a Colormap. If a dict the key must be a
-            string to assign as a name to a colormap and the value must be a
-            Colormap.
-        contrast_limits : list (2,)
-            Color limits to be used for determining the colormap bounds for
-            luminance images. If not passed is calculated as the min and max of
-            the image.
-        interpolation : str
-            Interpolation mode used by vispy. Must be one of our supported
-            modes.
-        name : str
-            Name of the layer.
-        metadata : dict
-            Layer metadata.
-        scale : tuple of float
-            Scale factors for the layer.
-        translate : tuple of float
-            Translation values for the layer.
-        opacity : float
-            Opacity of the layer visual, between 0.0 and 1.0.
-        blending : str
-            One of a list of preset blending modes that determines how RGB and
-            alpha values of the layer visual get mixed. Allowed values are
-            {'opaque', 'translucent', and 'additive'}.
-        visible : bool
-            Whether the layer visual is currently being displayed.
-
-        Returns
-        -------
-        layer : :class:`napari.layers.Image`
-            The newly-created image layer.
-        """
-        layer = layers.Image(
-            data,
-            multichannel=multichannel,
-            colormap=colormap,
-            contrast_limits=contrast_limits,
-            interpolation=interpolation,
-            rendering=rendering,
-            name=name,
-            metadata=metadata,
-            scale=scale,
-            translate=translate,
-            opacity=opacity,
-            blending=blending,
-            visible=visible,
-        )
-        self.add_layer(layer)
-        return layer
-
-    def add_pyramid(self, data, *args, **kwargs):
-        """Add an image pyramid layer to the layers list.
-
-        Parameters
-        ----------
-        data : list
-            Pyramid data. List of array like image date. Each image can be N
-            dimensional. If the last dimensions of the images have length 3
-            or 4 they can be interpreted as RGB or RGBA if multichannel is
-            `True`.
-        multichannel : bool
-            Whether the image is multichannel RGB or RGBA if multichannel. If
-            not specified by user and the last dimension of the data has length
-            3 or 4 it will be set as `True`. If `False` the image is
-            interpreted as a luminance image.
-        colormap : str, vispy.Color.Colormap, tuple, dict
-            Colormap to use for luminance images. If a string must be the name
-            of a supported colormap from vispy or matplotlib. If a tuple the
-            first value must be a string to assign as a name to a colormap and
-            the second item must be a Colormap. If a dict the key must be a
-            string to assign as a name to a colormap and the value must be a
-            Colormap.
-        contrast_limits : list (2,)
-            Color limits to be used for determining the colormap bounds for
-            luminance images. If not passed is calculated as the min and max of
-            the image.
-        interpolation : str
-            Interpolation mode used by vispy. Must be one of our supported
-            modes.
-        name : str
-            Name of the layer.
-        metadata : dict
-            Layer metadata.
-        scale : tuple of float
-            Scale factors for the layer.
-        translate : tuple of float
-            Translation values for the layer.
-        opacity : float
-            Opacity of the layer visual, between 0.0 and 1.0.
-        blending : str
-            One of a list of preset blending modes that determines how RGB and
-            alpha values of the layer visual get mixed. Allowed values are
-            {'opaque', 'translucent', and 'additive'}.
-        visible : bool
-            Whether the layer visual is currently being displayed.
-
-        Returns
-        -------
-        layer : :class:`napari.layers.Pyramid`
-            The newly-created pyramid layer.
-        """
-        layer = layers.Pyramid(data, *args, **kwargs)
-        self.add_layer(layer)
-        return layer
-
-    def add_points(
-        self,
-        data,
-        *,
-        symbol='o',
-        size=10,
-        edge_width=1,
-        edge_color='black',
-        face_color='white',
-        n_dimensional=False,
-        name=None,
-        metadata=None,
-        scale=None,
-        translate=None,
-        opacity=1,
-        blending='translucent',
-        visible=True,
-    ):
-        """Add a points layer to the layers list.
-
-        Parameters
-        ----------
-        data : array (N, D)
-            Coordinates for N points in D dimensions.
-        symbol : str
-            Symbol to be used for the point markers. Must be one of the
-            following: arrow, clobber, cross, diamond, disc, hbar, ring,
-            square, star, tailed_arrow, triangle_down, triangle_up, vbar, x.
-        size : float, array
-            Size of the point marker. If given as a scalar, all points are made
-            the same size. If given as an array, size must be the same
-            broadcastable to the same shape as the data.
-        edge_width : float
-            Width of the symbol edge in pixels.
-        edge_color : str
-            Color of the point marker border.
-        face_color : str
-            Color of the point marker body.
-        n_dimensional : bool
-            If True, renders points not just in central plane but also in all
-            n-dimensions according to specified point marker size.
-        name : str
-            Name of the layer.
-        metadata : dict
-            Layer metadata.
-        scale : tuple of float
-            Scale factors for the layer.
-        translate : tuple of float
-            Translation values for the layer.
-        opacity : float
-            Opacity of the layer visual, between 0.0 and 1.0.
-        blending : str
-            One of a list of preset blending modes that determines how RGB and
-            alpha values of the layer visual get mixed. Allowed values are
-            {'opaque', 'translucent', and 'additive'}.
-        visible : bool
-            Whether the layer visual is currently being displayed.
-
-        Returns
-        -------
-        layer : :class:`napari.layers.Points`
-            The newly-created points layer.
-
-        Notes
-        -----
-        See vispy's marker visual docs for more details:
-        http://api.vispy.org/en/latest/visuals.html#vispy.visuals.MarkersVisual
-        """
-        layer = layers.Points(
-            data,
-            symbol=symbol,
-            size=size,
-            edge_width=edge_width,
-            edge_color=edge_color,
-            face_color=face_color,
-            n_dimensional=n_dimensional,
-            name=name,
-            metadata=metadata,
-            scale=scale,
-            translate=translate,
-            opacity=opacity,
-            blending=blending,
-            visible=visible,
-        )
-        self.add_layer(layer)
-        return layer
-
-    def add_labels(
-        self,
-        data,
-        *,
-        num_colors=50,
-        seed=0.5,
-        n_dimensional=False,
-        name=None,
-        metadata=None,
-        scale=None,
-        translate=None,
-        opacity=0.7,
-        blending='translucent',
-        visible=True,
-    ):
-        """Add a labels (or segmentation) layer to the layers list.
-
-        An image-like layer where every pixel contains an integer ID
-        corresponding to the region it belongs to.
-
-        Parameters
-        ----------
-        data : array
-            Labels data.
-        num_colors : int
-            Number of unique colors to use in colormap.
-        seed : float
-            Seed for colormap random generator.
-        n_dimensional : bool
-            If `True`, paint and fill edit labels across all dimensions.
-        name : str
-            Name of the layer.
-        metadata : dict
-            Layer metadata.
-        scale : tuple of float
-            Scale factors for the layer.
-        translate : tuple of float
-            Translation values for the layer.
-        opacity : float
-            Opacity of the layer visual, between 0.0 and 1.0.
-        blending : str
-            One of a list of preset blending modes that determines how RGB and
-            alpha values of the layer visual get mixed. Allowed values are
-            {'opaque', 'translucent', and 'additive'}.
-        visible : bool
-            Whether the layer visual is currently being displayed.
-
-        Returns
-        -------
-        layer : :class:`napari.layers.Labels`
-            The newly-created labels layer.
-        """
-        layer = layers.Labels(
-            data,
-            num_colors=num_colors,
-            seed=seed,
-            n_dimensional=n_dimensional,
-            name=name,
-            metadata=metadata,
-            scale=scale,
-            translate=translate,
-            opacity=opacity,
-            blending=blending,
-            visible=visible,
-        )
-        self.add_layer(layer)
-        return layer
-
-    def add_shapes(
-        self,
-        data,
-        *,
-        shape_type='rectangle',
-        edge_width=1,
-        edge_color='black',
-        face_color='white',
-        z_index=0,
-        name=None,
-        metadata=None,
-        scale=None,
-        translate=None,
-        opacity=0.7,
-        blending='translucent',
-        visible=True,
-    ):
-        """Add a shapes layer to the layers list.
-
-        Parameters
-        ----------
-        data : list or array
-            List of shape data, where each element is an (N, D) array of the
-            N vertices of a shape in D dimensions. Can be an 3-dimensional
-            array if each shape has the same number of vertices.
-        shape_type : string or list
-            String of shape shape_type, must be one of "{'line', 'rectangle',
-            'ellipse', 'path', 'polygon'}". If a list is supplied it must be
-            the same length as the length of `data` and each element will be
-            applied to each shape otherwise the same value will be used for all
-            shapes.
-        edge_width : float or list
-            Thickness of lines and edges. If a list is supplied it must be the
-            same length as the length of `data` and each element will be
-            applied to each shape otherwise the same value will be used for all
-            shapes.
-        edge_color : str or list
-            If string can be any color name recognized by vispy or hex value if
-            starting with `#`. If array-like must be 1-dimensional array with 3
-            or 4 elements. If a list is supplied it must be the same length as
-            the length of `data` and each element will be applied to each shape
-            otherwise the same value will be used for all shapes.
-        face_color : str or list
-            If string can be any color name recognized by vispy or hex value if
-            starting with `#`. If array-like must be 1-dimensional array with 3
-            or 4 elements. If a list is supplied it must be the same length as
-            the length of `data` and each element will be applied to each shape
-            otherwise the same value will be used for all shapes.
-        z_index : int or list
-            Specifier of z order priority. Shapes with higher z order are
-            displayed ontop of others. If a list is supplied it must be the
-            same length as the length of `data` and each element will be
-            applied to each shape otherwise the same value will be used for all
-            shapes.
-        name : str
-            Name of the layer.
-        metadata : dict
-            Layer metadata.
-        scale : tuple of float
-            Scale factors for the layer.
-        translate : tuple of float
-            Translation values for the layer.
-        opacity : float or list
-            Opacity of the layer visual, between 0.0 and 1.0.
-        blending : str
-            One of a list of preset blending modes that determines how RGB and
-            alpha values of the layer visual get mixed. Allowed values are
-            {'opaque', 'translucent', and 'additive'}.
-        visible : bool
-            Whether the layer visual is currently being displayed.
-
-        Returns
-        -------
-        layer : :class:`napari.layers.Shapes`
-            The newly-created shapes layer.
-        """
-        layer = layers.Shapes(
-            data,
-            shape_type=shape_type,
-            edge_width=edge_width,
-            edge_color=edge_color,
-            face_color=face_color,
-            z_index=z_index,
-            name=name,
-            metadata=metadata,
-            scale=scale,
-            translate=translate,
-            opacity=opacity,
-            blending=blending,
-            visible=visible,
-        )
-        self.add_layer(layer)
-        return layer
-
-    def add_vectors(
-        self,
-        data,
-        *,
-        edge_width=1,
-        edge_color='red',
-        length=1,
-        name=None,
-        metadata=None,
-        scale=None,
-        translate=None,
-        opacity=0.7,
-        blending='translucent',
-        visible=True,
-    ):
-        """Add a vectors layer to the layers list.
-
-        Parameters
-        ----------
-        data : (N, 2, D) or (N1, N2, ..., ND, D) array
-            An (N, 2, D) array is interpreted as "coordinate-like" data and a
-            list of N vectors with start point and projections of the vector in
-            D dimensions. An (N1, N2, ..., ND, D) array is interpreted as
-            "image-like" data where there is a length D vector of the
-            projections at each pixel.
-        edge_width : float
-            Width for all vectors in pixels.
-        length : float
-             Multiplicative factor on projections for length of all vectors.
-        edge_color : str
-            Edge color of all the vectors.
-        name : str
-            Name of the layer.
-        metadata : dict
-            Layer metadata.
-        scale : tuple of float
-            Scale factors for the layer.
-        translate : tuple of float
-            Translation values for the layer.
-        opacity : float
-            Opacity of the layer visual, between 0.0 and 1.0.
-        blending : str
-            One of a list of preset blending modes that determines how RGB and
-            alpha values of the layer visual get mixed. Allowed values are
-            {'opaque', 'translucent', and 'additive'}.
-        visible : bool
-            Whether the layer visual is currently being displayed.
-
-        Returns
-        -------
-        layer : :class:`napari.layers.Vectors`
-            The newly-created vectors layer.
-        """
-        layer = layers.Vectors(
-            data,
-            edge_width=edge_width,
-            edge_color=edge_color,
-            length=length,
-            name=name,
-            metadata=metadata,
-            scale=scale,
-            translate=translate,
-            opacity=opacity,
-            blending=blending,
-            visible=visible,
-        )
-        self.add_layer(layer)
-        return layer
+    # Zero-length sentinel arrays for new empty layers, keyed by ndim.
+    # Sharing them is safe because layers never mutate zero-sized data in
+    # place; edits always rebind to a freshly built array.
+    _EMPTY_POINTS = {}
+    _EMPTY_SHAPES = {}
 
     def _new_points(self):
         if self.dims.ndim == 0:
             ndim = 2
         else:
             ndim = self.dims.ndim
-        self.add_points(np.empty((0, ndim)))
+        data = self._EMPTY_POINTS.get(ndim)
+        if data is None:
+            data = np.empty((0, ndim), dtype=np.float32)
+            self._EMPTY_POINTS[ndim] = data
+        self.add_points(data)
 
     def _new_shapes(self):
         if self.dims.ndim == 0:
             ndim = 2
         else:
             ndim = self.dims.ndim
-        layer = self.add_shapes(np.empty((0, 0, ndim)))
+        data = self._EMPTY_SHAPES.get(ndim)
+        if data is None:
+            data = np.empty((0, 0, ndim), dtype=np.float32)
+            self._EMPTY_SHAPES[ndim] = data
+        layer = self.add_shapes(data)
 
     def _new_labels(self):
         if self.dims.ndim == 0:
             dims = (512, 512)
         else:
-            dims = self._calc_bbox()[1]
-            dims = [np.ceil(d).astype('int') if d > 0 else 1 for d in dims]
+            max_shape = self._calc_bbox()[1]
+            dims = tuple(
+                np.where(max_shape > 0, np.ceil(max_shape), 1).astype(np.intp)
+            )
             if len(dims) < 1:
                 dims = (512, 512)
-        empty_labels = np.zeros(dims, dtype=int)
-        self.add_labels(empty_labels)
+        # use the smallest integer width that can hold the default number
+        # of label colors instead of a full int64 array
+        num_colors = 50
+        if num_colors < 2 ** 8:
+            dtype = np.uint8
+        elif num_colors < 2 ** 16:
+            dtype = np.uint16
+        else:
+            dtype = np.uint32
+        empty_labels = np.zeros(dims, dtype=dtype)
+        self.add_labels(empty_labels, num_colors=num_colors)
+
+    def _schedule_layers_update(self, event=None):
+        """Run a full layers update, coalescing re-entrant requests.
+
+        The ndisplay, order and axis dims events all request a full
+        update, and an update itself can re-trigger those events (for
+        example when it changes the number of dimensions). Requests that
+        arrive while an update is running only mark the state dirty; the
+        outermost call then reruns once instead of recursing per event.
+
+        Parameters
+        ----------
+        event : Event, optional
+            No Event parameters are used.
+        """
+        if self._layers_updating:
+            self._layers_update_pending = True
+            return
+
+        self._layers_updating = True
+        try:
+            self._update_layers()
+            while self._layers_update_pending:
+                self._layers_update_pending = False
+                self._update_layers()
+        finally:
+            self._layers_updating = False
 
     def _update_layers(self, layers=None):
         """Updates the contained layers.
@@ -823,6 +491,11 @@ class ViewerModel(KeymapMixin):
         """
         layers = layers or self.layers
 
+        ndim = self.dims.ndim
+        ndisplay = self.dims.ndisplay
+        order_arr = self.dims._order_array
+        point = self.dims.point
+
         for layer in layers:
             # adjust the order of the global dims based on the number of
             # dimensions that a layer has - for example a global order of
@@ -830,20 +503,20 @@ class ViewerModel(KeymapMixin):
             # or -> [1, 0, 2] for a layer with three as that corresponds to
             # the relative order of the last two and three dimensions
             # respectively
-            offset = self.dims.ndim - layer.dims.ndim
-            order = np.array(self.dims.order)
+            layer_dims = layer.dims
+            offset = ndim - layer_dims.ndim
             if offset <= 0:
-                order = list(range(-offset)) + list(order - offset)
+                order = list(range(-offset)) + list(order_arr - offset)
             else:
-                order = list(order[order >= offset] - offset)
-            layer.dims.order = order
-            layer.dims.ndisplay = self.dims.ndisplay
+                order = list(order_arr[order_arr >= offset] - offset)
+            layer_dims.order = order
+            layer_dims.ndisplay = ndisplay
 
             # Update the point values of the layers for the dimensions that
             # the layer has
-            for axis in range(layer.dims.ndim):
-                point = self.dims.point[axis + offset]
-                layer.dims.set_point(axis, point)
+            set_point = layer_dims.set_point
+            for axis in range(layer_dims.ndim):
+                set_point(axis, point[axis + offset])
 
     def _update_active_layer(self, event):
         """Set the active layer by iterating over the layers list and
@@ -855,20 +528,18 @@ class ViewerModel(KeymapMixin):
         event : Event
             No Event parameters are used
         """
-        # iteration goes backwards to find top most selected layer if any
-        # if multiple layers are selected sets the active layer to None
-        active_layer = None
-        for layer in self.layers:
-            if active_layer is None and layer.selected:
-                active_layer = layer
-            elif active_layer is not None and layer.selected:
-                active_layer = None
-                break
+        # the selection set is maintained incrementally by the layer list,
+        # so the active layer is found without rescanning every layer
+        selected = self.layers._selected_set
+        if len(selected) == 1:
+            (active_layer,) = selected
+        else:
+            active_layer = None
 
         if active_layer is None:
-            self.status = 'Ready'
+            self.status = _READY
             self.help = ''
-            self.cursor = 'standard'
+            self.cursor = _STANDARD_CURSOR
             self.interactive = True
             self.active_layer = None
         else:
@@ -879,6 +550,9 @@ class ViewerModel(KeymapMixin):
             self.active_layer = active_layer
 
     def _on_layers_change(self, event):
+        # any data or dims change invalidates the cached ranges and bbox
+        self._ranges_cache = None
+        self._bbox_cache = None
         layer_range = self._calc_layers_ranges()
         self.dims.ndim = len(layer_range)
         for i, r in enumerate(layer_range):
@@ -886,48 +560,65 @@ class ViewerModel(KeymapMixin):
 
     def _calc_layers_ranges(self):
         """Calculates the range along each axis from all present layers.
-        """
 
-        ndims = self._calc_layers_num_dims()
-        ranges = [(inf, -inf, inf)] * ndims
-
-        for layer in self.layers:
-            layer_range = layer.dims.range[::-1]
-            ranges = [
-                (min(a, b), max(c, d), min(e, f))
-                for (a, c, e), (b, d, f) in zip_longest(
-                    ranges, layer_range, fillvalue=(inf, -inf, inf)
-                )
-            ]
-
-        return ranges[::-1]
+        The result is memoized and invalidated in `_on_layers_change`, so
+        repeated consumers such as `_calc_bbox` do not retraverse the layer
+        list. Per-layer ranges are collected into a single padded array and
+        reduced with NumPy instead of rebuilding a list of tuples per layer.
+        """
+        if self._ranges_cache is not None:
+            return self._ranges_cache
+
+        layers = list(self.layers)
+        ndims = max((layer.ndim for layer in layers), default=0)
+
+        if ndims == 0:
+            self._ranges_cache = []
+            return self._ranges_cache
+
+        # Axes are aligned from the last dimension, so per-layer ranges are
+        # written reversed and padded with the (inf, -inf, inf) identity.
+        mins = np.full((len(layers), ndims), inf)
+        maxs = np.full((len(layers), ndims), -inf)
+        steps = np.full((len(layers), ndims), inf)
+
+        for i, layer in enumerate(layers):
+            layer_range = np.asarray(layer.dims.range[::-1], dtype=float)
+            mins[i, : len(layer_range)] = layer_range[:, 0]
+            maxs[i, : len(layer_range)] = layer_range[:, 1]
+            steps[i, : len(layer_range)] = layer_range[:, 2]
+
+        self._ranges_cache = list(
+            zip(
+                mins.min(0).tolist(),
+                maxs.max(0).tolist(),
+                steps.min(0).tolist(),
+            )
+        )[::-1]
+        return self._ranges_cache
 
     def _calc_bbox(self):
         """Calculates the bounding box of all displayed layers.
         This assumes that all layers are stacked.
-        """
-
-        min_shape = []
-        max_shape = []
-        for min, max, step in self._calc_layers_ranges():
-            min_shape.append(min)
-            max_shape.append(max)
-        if len(min_shape) == 0:
-            min_shape = [0] * self.dims.ndim
-            max_shape = [1] * self.dims.ndim
-
-        return min_shape, max_shape
 
-    def _calc_layers_num_dims(self):
-        """Calculates the number of maximum dimensions in the contained images.
+        Returns
+        -------
+        bbox : np.ndarray
+            Array of shape (2, ndim) holding the minimum and maximum
+            extents along each axis.
         """
-        max_dims = 0
-        for layer in self.layers:
-            dims = layer.ndim
-            if dims > max_dims:
-                max_dims = dims
+        if self._bbox_cache is not None:
+            return self._bbox_cache
+
+        ranges = self._calc_layers_ranges()
+        if len(ranges) == 0:
+            bbox = np.zeros((2, self.dims.ndim))
+            bbox[1] = 1
+        else:
+            bbox = np.asarray(ranges, dtype=float)[:, :2].T
 
-        return max_dims
+        self._bbox_cache = bbox
+        return bbox
 
     def _update_status(self, event):
         """Set the viewer status with the `event.status` string."""
@@ -948,3 +639,20 @@ class ViewerModel(KeymapMixin):
     def _update_cursor_size(self, event):
         """Set the viewer cursor_size with the `event.cursor_size` int."""
         self.cursor_size = event.cursor_size
+
+
+# The add_<layer> convenience methods are generated from the layer classes
+# themselves so that their signatures, docstrings and forwarding code stay
+# in sync with the constructors without hand-maintained boilerplate.
+for _layer_cls in (
+    layers.Image,
+    layers.Pyramid,
+    layers.Points,
+    layers.Labels,
+    layers.Shapes,
+    layers.Vectors,
+):
+    _func = create_func(_layer_cls)
+    setattr(ViewerModel, _func.__name__, _func)
+
+del _layer_cls, _func
@@ -1,8 +1,9 @@
 from typing import Union
-import warnings
 import numpy as np
 from copy import copy
 from scipy import ndimage as ndi
+from skimage.morphology import flood
+from skimage.transform import resize
 from xml.etree.ElementTree import Element
 from base64 import b64encode
 from imageio import imwrite
@@ -100,6 +101,14 @@ class Labels(Layer):
     _last_cursor_coord : list or None
         Coordinates of last cursor click before painting, gets reset to None
         after painting is done. Used for interpolating brush strokes.
+    _colormapped_thumbnail : array (N, M, 4) or None
+        Cached colormapped thumbnail used for incremental updates during
+        painting, or None if no full thumbnail has been rendered yet.
+    _thumbnail_zoom_factor : float or None
+        Zoom factor the cached thumbnail was rendered with.
+    _xml_cache : tuple or None
+        Cached (key, image string) pair of the last svg export, or None if
+        the viewed slice changed since.
     """
 
     def __init__(
@@ -160,6 +169,9 @@ class Labels(Layer):
         self._contiguous = True
         self._brush_size = 10
         self._last_cursor_coord = None
+        self._colormapped_thumbnail = None
+        self._thumbnail_zoom_factor = None
+        self._xml_cache = None
 
         self._selected_label = 0
         self._selected_color = None
@@ -229,7 +241,7 @@ class Labels(Layer):
     @seed.setter
     def seed(self, seed):
         self._seed = seed
-        self._set_view_slice()
+        self._recolor_view()
 
     @property
     def num_colors(self):
@@ -243,7 +255,7 @@ class Labels(Layer):
             self._colormap_name,
             colormaps.label_colormap(num_colors),
         )
-        self._set_view_slice()
+        self._recolor_view()
 
     @property
     def selected_label(self):
@@ -320,7 +332,7 @@ class Labels(Layer):
         self.events.mode(mode=mode)
         self._set_view_slice()
 
-    def _raw_to_displayed(self, raw):
+    def _raw_to_displayed(self, raw, out=None):
         """Determine displayed image from a saved raw image and a saved seed.
 
         This function ensures that the 0 label gets mapped to the 0 displayed
@@ -330,39 +342,120 @@ class Labels(Layer):
         -------
         raw : array or int
             Raw integer input image.
+        out : array, optional
+            Buffer to write the displayed image into. Reused when its shape
+            and dtype match, otherwise a new buffer is allocated.
 
         Returns
         -------
         image : array
             Image mapped between 0 and 1 to be displayed.
         """
-        image = np.where(
-            raw > 0, colormaps._low_discrepancy_image(raw, self._seed), 0
-        )
-        return image
+        raw = np.asarray(raw)
+        # Only map the foreground pixels; the (typically dominant)
+        # background stays zero without being run through the colormap.
+        mask = raw > 0
+        if out is None or out.shape != raw.shape or out.dtype != np.float32:
+            out = np.zeros(raw.shape, dtype=np.float32)
+        else:
+            out[~mask] = 0
+        out[mask] = colormaps._low_discrepancy_image(raw[mask], self._seed)
+        return out
+
+    def _map_labels_to_colors(self, image):
+        """Map a label image directly to RGBA colors.
+
+        The colormap is evaluated once per unique label instead of once per
+        pixel, then gathered over the image — a label slice usually holds
+        far fewer distinct values than pixels.
+
+        Parameters
+        ----------
+        image : array
+            Label image to colormap.
+
+        Returns
+        -------
+        colormapped : array
+            Float RGBA array of shape ``image.shape + (4,)``.
+        """
+        unique_labels, inverse = np.unique(image, return_inverse=True)
+        colors = self.colormap[1].map(self._raw_to_displayed(unique_labels))
+        return colors[inverse].reshape(image.shape + (4,))
 
     def new_colormap(self):
         self._seed = np.random.rand()
         self._selected_color = self.get_color(self.selected_label)
-        self._set_view_slice()
+        self._recolor_view()
 
     def get_color(self, label):
         """Return the color corresponding to a specific label."""
         if label == 0:
             col = None
         else:
-            val = self._raw_to_displayed(np.array([label]))
+            # The label is known to be foreground, so apply the
+            # low-discrepancy mapping directly instead of going through the
+            # masking machinery of _raw_to_displayed.
+            val = colormaps._low_discrepancy_image(
+                np.array([label], dtype=float), self._seed
+            )
             col = self.colormap[1].map(val)[0]
         return col
 
-    def _set_view_slice(self):
-        """Sets the view given the indices to slice with."""
-        self._data_labels = np.asarray(self.data[self.dims.indices]).transpose(
-            self.dims.displayed_order
+    def _set_view_slice(self, dirty=None):
+        """Sets the view given the indices to slice with.
+
+        Parameters
+        ----------
+        dirty : tuple of slice, optional
+            Region of the data modified since the last update, one entry per
+            data dimension. When given, only the matching part of the
+            thumbnail is re-rendered.
+        """
+        self._reslice_labels()
+        self._recolor_view(dirty=dirty)
+
+    def _reslice_labels(self):
+        """Extract the currently viewed slice of the data."""
+        displayed_order = self.dims.displayed_order
+        sliced = np.asarray(self.data[self.dims.indices])
+        if displayed_order != tuple(range(self.dims.ndisplay)):
+            sliced = sliced.transpose(displayed_order)
+        # Reuse the persistent slice buffers when the shape is unchanged
+        # (the common case during painting) to avoid reallocating the full
+        # slice on every refresh.
+        if (
+            self._data_labels.shape == sliced.shape
+            and self._data_labels.dtype == sliced.dtype
+        ):
+            np.copyto(self._data_labels, sliced)
+        else:
+            self._data_labels = sliced.copy()
+
+    def _recolor_view(self, dirty=None):
+        """Recompute the displayed colors from the cached label slice.
+
+        Called on its own when only the seed or colormap changed, so the
+        potentially expensive slicing of the full data is skipped.
+
+        Parameters
+        ----------
+        dirty : tuple of slice, optional
+            Region of the data modified since the last update, one entry per
+            data dimension.
+        """
+        self._xml_cache = None
+        self._data_view = self._raw_to_displayed(
+            self._data_labels, out=self._data_view
         )
-        self._data_view = self._raw_to_displayed(self._data_labels)
 
-        self._update_thumbnail()
+        if dirty is not None and self.dims.ndisplay == 2:
+            # Map the dirty data region onto the displayed slice axes,
+            # which are ordered by dims.displayed after the transpose.
+            dirty = tuple(dirty[d] for d in self.dims.displayed)
+        else:
+            dirty = None
+        self._update_thumbnail(dirty=dirty)
         self._update_coordinates()
         self.events.set_data()
 
@@ -393,26 +486,38 @@ class Labels(Layer):
             labels = self._data_labels
             slice_coord = tuple(int_coord[d] for d in self.dims.displayed)
 
-        matches = labels == old_label
-        if self.contiguous:
-            # if not contiguous replace only selected connected component
-            labeled_matches, num_features = ndi.label(matches)
-            if num_features != 1:
-                match_label = labeled_matches[slice_coord]
-                matches = np.logical_and(
-                    matches, labeled_matches == match_label
-                )
+        if self.contiguous and labels[slice_coord] == old_label:
+            # replace only the connected component containing the click by
+            # flooding from it, instead of labeling every component in the
+            # image and discarding all but one
+            matches = flood(labels, slice_coord, connectivity=1)
+        else:
+            matches = labels == old_label
+            if self.contiguous:
+                # if not contiguous replace only selected connected component
+                labeled_matches, num_features = ndi.label(matches)
+                if num_features != 1:
+                    match_label = labeled_matches[slice_coord]
+                    matches = np.logical_and(
+                        matches, labeled_matches == match_label
+                    )
 
         # Replace target pixels with new_label
         labels[matches] = new_label
 
         if not (self.n_dimensional or self.ndim == 2):
-            # if working with just the slice, update the rest of the raw data
-            self.data[tuple(self.indices)] = labels
+            # if working with just the slice, write the edited slice back
+            # into the raw data; the slice buffer is a private copy, so the
+            # edit would otherwise be lost on the next reslice
+            displayed_order = self.dims.displayed_order
+            if displayed_order != tuple(range(self.dims.ndisplay)):
+                # undo the display transpose applied by _reslice_labels
+                labels = labels.transpose(np.argsort(displayed_order))
+            self.data[self.dims.indices] = labels
 
         self._set_view_slice()
 
-    def paint(self, coord, new_label):
+    def paint(self, coord, new_label, refresh=True):
         """Paint over existing labels with a new label, using the selected
         brush shape and size, either only on the visible slice or in all
         n dimensions.
@@ -423,50 +528,67 @@ class Labels(Layer):
             Position of mouse cursor in image coordinates.
         new_label : int
             Value of the new label to be filled in.
+        refresh : bool
+            Whether to refresh the view after painting. Set to False when
+            painting many coordinates in a row and refresh once at the end.
+
+        Returns
+        -------
+        slice_coord : tuple
+            Region of the data covered by the brush, one entry per data
+            dimension.
+        """
+        slice_coord = self._brush_extent(coord)
+
+        # update the labels image
+        self.data[slice_coord] = new_label
+
+        if refresh:
+            self._set_view_slice(dirty=slice_coord)
+        return slice_coord
+
+    def _brush_extent(self, coord):
+        """Compute the region of the data covered by the brush at a point.
+
+        Parameters
+        ----------
+        coord : sequence of int
+            Position of mouse cursor in image coordinates.
+
+        Returns
+        -------
+        slice_coord : tuple
+            One entry per data dimension; slices on the painted axes and
+            integer positions on the remaining axes.
         """
+        # Compute the brush extents for all axes in one vectorized pass
+        # instead of four rounded clips per dimension.
+        coord_arr = np.asarray(coord, dtype=float)
+        shape_arr = np.asarray(self.shape)
+        half = self.brush_size / 2 - 0.5
+        lo = (
+            np.round(np.clip(coord_arr - half, 0, shape_arr))
+            .astype(int)
+            .tolist()
+        )
+        hi = (
+            np.round(np.clip(coord_arr + half + 1, 0, shape_arr))
+            .astype(int)
+            .tolist()
+        )
+
         if self.n_dimensional or self.ndim == 2:
-            slice_coord = tuple(
-                [
-                    slice(
-                        np.round(
-                            np.clip(c - self.brush_size / 2 + 0.5, 0, s)
-                        ).astype(int),
-                        np.round(
-                            np.clip(c + self.brush_size / 2 + 0.5, 0, s)
-                        ).astype(int),
-                        1,
-                    )
-                    for c, s in zip(coord, self.shape)
-                ]
-            )
+            slice_coord = tuple(slice(l, h, 1) for l, h in zip(lo, hi))
         else:
+            rounded = np.round(coord_arr).astype(int).tolist()
             slice_coord = [0] * self.ndim
             for i in self.dims.displayed:
-                slice_coord[i] = slice(
-                    np.round(
-                        np.clip(
-                            coord[i] - self.brush_size / 2 + 0.5,
-                            0,
-                            self.shape[i],
-                        )
-                    ).astype(int),
-                    np.round(
-                        np.clip(
-                            coord[i] + self.brush_size / 2 + 0.5,
-                            0,
-                            self.shape[i],
-                        )
-                    ).astype(int),
-                    1,
-                )
+                slice_coord[i] = slice(lo[i], hi[i], 1)
             for i in self.dims.not_displayed:
-                slice_coord[i] = np.round(coord[i]).astype(int)
+                slice_coord[i] = rounded[i]
             slice_coord = tuple(slice_coord)
 
-        # update the labels image
-        self.data[slice_coord] = new_label
-
-        self._set_view_slice()
+        return slice_coord
 
     def get_value(self):
         """Returns coordinates, values, and a string for a given mouse position
@@ -479,38 +601,110 @@ class Labels(Layer):
         value : int or float or sequence of int or float or None
             Value of the data at the coord, or none if coord is outside range.
         """
-        coord = np.round(self.coordinates).astype(int)
+        # Runs on every mouse move; use plain scalar rounding and bounds
+        # checks on the displayed axes instead of rounding the full
+        # coordinate vector and fancy-indexing it twice.
+        coordinates = self.coordinates
         shape = self._data_labels.shape
-        if all(0 <= c < s for c, s in zip(coord[self.dims.displayed], shape)):
-            value = self._data_labels[tuple(coord[self.dims.displayed])]
-        else:
-            value = None
+        coord = []
+        for d, s in zip(self.dims.displayed, shape):
+            c = int(round(coordinates[d]))
+            if c < 0 or c >= s:
+                return None
+            coord.append(c)
 
-        return value
+        return self._data_labels[tuple(coord)]
 
-    def _update_thumbnail(self):
+    def _update_thumbnail(self, dirty=None):
         """Update thumbnail with current image data and colors.
+
+        Parameters
+        ----------
+        dirty : tuple of slice, optional
+            Modified region of the displayed slice. When given and a cached
+            thumbnail exists, only the matching thumbnail pixels are
+            re-rendered and composited into the cache; otherwise the full
+            thumbnail is rebuilt.
         """
         if self.dims.ndisplay == 3:
             image = np.max(self._data_labels, axis=0)
+            dirty = None
         else:
             image = self._data_labels
 
         zoom_factor = np.divide(
             self._thumbnail_shape[:2], image.shape[:2]
         ).min()
-        # warning filter can be removed with scipy 1.4
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            downsampled = np.round(
-                ndi.zoom(image, zoom_factor, prefilter=False, order=0)
+
+        if (
+            dirty is None
+            or self._colormapped_thumbnail is None
+            or zoom_factor != self._thumbnail_zoom_factor
+        ):
+            # Nearest-neighbor downsampling by an integer factor is plain
+            # strided indexing; otherwise fall back to a nearest-neighbor
+            # resize. Either way no float interpolation pass is needed.
+            inv_factor = 1 / zoom_factor
+            step = int(round(inv_factor))
+            if zoom_factor == 1:
+                downsampled = image
+            elif step > 1 and step == inv_factor:
+                downsampled = image[::step, ::step]
+            else:
+                output_shape = np.round(
+                    np.multiply(image.shape[:2], zoom_factor)
+                ).astype(int)
+                downsampled = resize(
+                    image,
+                    output_shape,
+                    order=0,
+                    anti_aliasing=False,
+                    preserve_range=True,
+                )
+            colormapped = self._map_labels_to_colors(downsampled)
+            # render background as black instead of transparent
+            colormapped[..., 3] = 1
+            colormapped[..., 3] *= self.opacity
+            self._colormapped_thumbnail = colormapped
+            self._thumbnail_zoom_factor = zoom_factor
+            self.thumbnail = colormapped
+            return
+
+        # Re-render only the thumbnail pixels covered by the dirty region
+        # and composite them into the cached full thumbnail. A one pixel
+        # margin absorbs rounding at the region edges.
+        colormapped = self._colormapped_thumbnail
+        inv_factor = 1 / zoom_factor
+        step = int(round(inv_factor))
+        targets = []
+        sources = []
+        for ax, sl in enumerate(dirty[:2]):
+            start = 0 if sl.start is None else sl.start
+            stop = image.shape[ax] if sl.stop is None else sl.stop
+            t0 = max(int(start * zoom_factor) - 1, 0)
+            t1 = min(
+                int(np.ceil(stop * zoom_factor)) + 1, colormapped.shape[ax]
             )
-        downsampled = self._raw_to_displayed(downsampled)
-        colormapped = self.colormap[1].map(downsampled)
-        colormapped = colormapped.reshape(downsampled.shape + (4,))
-        # render background as black instead of transparent
-        colormapped[..., 3] = 1
-        colormapped[..., 3] *= self.opacity
+            if t1 <= t0:
+                return
+            # Sample the same nearest-neighbor grid as the full rebuild:
+            # plain strides when the inverse zoom is an exact integer,
+            # otherwise the pixel-center mapping of resize with order=0
+            # at the actual per-axis scale of the cached thumbnail.
+            if step == inv_factor:
+                src = np.arange(t0, t1) * step
+            else:
+                scale = image.shape[ax] / colormapped.shape[ax]
+                src = ((np.arange(t0, t1) + 0.5) * scale).astype(int)
+            np.clip(src, 0, image.shape[ax] - 1, out=src)
+            targets.append(slice(t0, t1))
+            sources.append(src)
+
+        sub = image[np.ix_(*sources)]
+        mapped = self._map_labels_to_colors(sub)
+        mapped[..., 3] = 1
+        mapped[..., 3] *= self.opacity
+        colormapped[tuple(targets)] = mapped
         self.thumbnail = colormapped
 
     def to_xml_list(self):
@@ -523,12 +717,21 @@ class Labels(Layer):
             List of a single xml element specifying the currently viewed image
             as a png according to the svg specification.
         """
-        mapped_image = (self.colormap[1].map(self._data_view) * 255).astype(
-            np.uint8
-        )
-        mapped_image = mapped_image.reshape(list(self._data_view.shape) + [4])
-        image_str = imwrite('<bytes>', mapped_image, format='png')
-        image_str = "data:image/png;base64," + str(b64encode(image_str))[2:-1]
+        # The png encode and base64 step dominate; reuse the encoded string
+        # while the slice, seed and colormap are unchanged. Opacity lives on
+        # the element itself so it does not invalidate the cache.
+        key = (self._seed, id(self.colormap[1]))
+        if self._xml_cache is not None and self._xml_cache[0] == key:
+            image_str = self._xml_cache[1]
+        else:
+            mapped_image = (
+                self._map_labels_to_colors(self._data_labels) * 255
+            ).astype(np.uint8)
+            image_str = imwrite('<bytes>', mapped_image, format='png')
+            image_str = (
+                "data:image/png;base64," + str(b64encode(image_str))[2:-1]
+            )
+            self._xml_cache = (key, image_str)
         props = {'xlink:href': image_str}
         width = str(self.shape[self.dims.displayed[1]])
         height = str(self.shape[self.dims.displayed[0]])
@@ -577,10 +780,31 @@ class Labels(Layer):
                 interp_coord = interpolate_coordinates(
                     self._last_cursor_coord, self.coordinates, self.brush_size
                 )
-            with self.events.set_data.blocker():
-                for c in interp_coord:
-                    self.paint(c, new_label)
-            self._set_view_slice()
+            # Union all the brush stamps of the stroke into one boolean
+            # mask over their bounding box and write the new label with a
+            # single masked assignment, then refresh once.
+            regions = [self._brush_extent(c) for c in interp_coord]
+            dirty = list(regions[0])
+            for region in regions[1:]:
+                for i, (a, b) in enumerate(zip(dirty, region)):
+                    if isinstance(a, slice):
+                        dirty[i] = slice(
+                            min(a.start, b.start), max(a.stop, b.stop), 1
+                        )
+            dirty = tuple(dirty)
+
+            bbox_view = self.data[dirty]
+            mask = np.zeros(bbox_view.shape, dtype=bool)
+            for region in regions:
+                local = tuple(
+                    slice(r.start - d.start, r.stop - d.start)
+                    for r, d in zip(region, dirty)
+                    if isinstance(r, slice)
+                )
+                mask[local] = True
+            bbox_view[mask] = new_label
+
+            self._set_view_slice(dirty=dirty)
             self._last_cursor_coord = copy(self.coordinates)
 
     def on_mouse_release(self, event):
@@ -1,269 +1,229 @@
 import numpy as np
+import pytest
 
 from napari import Viewer
 
+_RNG_SEED = 0
 
-def test_nD_image(qtbot):
-    """Test adding nD image."""
+# dims.order permutations exercised by the tests below
+_ORDER_SWAP_3D = (0, 2, 1)
+_ORDER_ROLL_3D = (1, 0, 2)
+_ORDER_SWAP_4D = (0, 2, 1, 3)
+_ORDER_ROLL_4D = (1, 0, 2, 3)
+
+
+def _assert_data_equal(layer_data, data):
+    """Check that layer data round-trips what was added.
+
+    Layers usually store the array they were given, so the identity check
+    short-circuits the full elementwise comparison on the happy path.
+    """
+    if isinstance(layer_data, list):
+        assert all(
+            ld is d or np.array_equal(ld, d) for ld, d in zip(layer_data, data)
+        )
+    else:
+        assert layer_data is data or np.array_equal(layer_data, data)
+
+
+@pytest.fixture(scope="module")
+def _module_viewer(qapp):
+    """Single viewer shared by the module; one Qt init instead of nine."""
     viewer = Viewer()
+    yield viewer
+    viewer.window.close()
+
+
+@pytest.fixture
+def shared_viewer(_module_viewer):
+    """Yield the shared viewer, clearing its layers and dims afterwards."""
+    yield _module_viewer
+    while len(_module_viewer.layers) > 0:
+        _module_viewer.layers.pop(0)
+    _module_viewer.dims.ndisplay = 2
+    # dims keep their ndim and order after the layers are gone, so undo
+    # any reordering the test applied
+    dims = _module_viewer.dims
+    dims.order = tuple(range(dims.ndim))
+
+
+@pytest.fixture(scope="module")
+def nd_image_data():
+    """nD image data shared read-only across this module."""
+    rng = np.random.default_rng(_RNG_SEED)
+    return rng.random((6, 10, 15))
+
+
+@pytest.fixture(scope="module")
+def nd_volume_data():
+    """nD volume data shared read-only across this module."""
+    rng = np.random.default_rng(_RNG_SEED)
+    # float32 halves the bytes every downstream copy and upload touches
+    return rng.random((6, 10, 15, 20), dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def nd_pyramid_data():
+    """nD image pyramid data shared read-only across this module."""
+    shapes = [(8, 40, 20), (4, 20, 10), (4, 10, 5)]
+    rng = np.random.default_rng(_RNG_SEED)
+    return [rng.random(s, dtype=np.float32) for s in shapes]
+
+
+@pytest.fixture(scope="module")
+def nd_labels_data():
+    """nD labels data shared read-only across this module."""
+    rng = np.random.default_rng(_RNG_SEED)
+    return rng.integers(20, size=(6, 10, 15), dtype=np.int32)
+
+
+@pytest.fixture(scope="module")
+def nd_points_data():
+    """nD points data shared read-only across this module."""
+    rng = np.random.default_rng(_RNG_SEED)
+    return 20 * rng.random((10, 3))
+
+
+@pytest.fixture(scope="module")
+def nd_vectors_data():
+    """nD vectors data shared read-only across this module."""
+    rng = np.random.default_rng(_RNG_SEED)
+    data = 20 * rng.random((10, 2, 3))
+    # pin one vector per plane so every slice position, including the
+    # default mid-range one, has something to display
+    data[:, 0, 0] = np.arange(10)
+    return data
+
+
+@pytest.fixture(scope="module")
+def nd_shapes_data():
+    """nD shapes data shared read-only across this module."""
+    rng = np.random.default_rng(_RNG_SEED)
+    # create one random rectangle per "plane", filling a preallocated
+    # array in place instead of tiling and concatenating temporaries
+    data = np.empty((10, 4, 3), dtype=np.float64)
+    data[:, :, 0] = np.arange(10)[:, None]
+    data[:, :, 1:] = rng.uniform(0, 10, size=(10, 4, 2))
+    return data
+
+
+@pytest.mark.parametrize(
+    'layer_kind,data_fixture',
+    [
+        ('image', 'nd_image_data'),
+        ('pyramid', 'nd_pyramid_data'),
+        ('labels', 'nd_labels_data'),
+        ('points', 'nd_points_data'),
+        ('vectors', 'nd_vectors_data'),
+        ('shapes', 'nd_shapes_data'),
+    ],
+)
+def test_nD_layer(shared_viewer, request, layer_kind, data_fixture):
+    """Test adding each nD layer type."""
+    viewer = shared_viewer
     view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
+    # bind the hot Qt attribute chains once
+    layout_count = view.layers.vbox_layout.count
+    displayed_sliders = view.dims._displayed_sliders
 
-    np.random.seed(0)
-    data = np.random.random((6, 10, 15))
-    viewer.add_image(data)
-    assert np.all(viewer.layers[0].data == data)
+    data = request.getfixturevalue(data_fixture)
+    getattr(viewer, f'add_{layer_kind}')(data)
+    _assert_data_equal(viewer.layers[0].data, data)
 
     assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
+    assert layout_count() == 2 * len(viewer.layers) + 2
 
     assert viewer.dims.ndim == 3
     assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
+    assert sum(displayed_sliders) == 1
 
     # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1]
-    assert viewer.dims.order == [0, 2, 1]
+    viewer.dims.order = _ORDER_SWAP_3D
+    assert tuple(viewer.dims.order) == _ORDER_SWAP_3D
 
     # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2]
-    assert viewer.dims.order == [1, 0, 2]
+    viewer.dims.order = _ORDER_ROLL_3D
+    assert tuple(viewer.dims.order) == _ORDER_ROLL_3D
 
-    # Close the viewer
-    viewer.window.close()
 
-
-def test_nD_volume(qtbot):
+def test_nD_volume(shared_viewer, nd_volume_data):
     """Test adding nD volume."""
-    viewer = Viewer()
+    viewer = shared_viewer
     view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
+    # bind the hot Qt attribute chains once
+    layout_count = view.layers.vbox_layout.count
+    displayed_sliders = view.dims._displayed_sliders
 
-    np.random.seed(0)
-    data = np.random.random((6, 10, 15, 20))
+    data = nd_volume_data
     viewer.add_image(data)
     viewer.dims.ndisplay = 3
-    assert np.all(viewer.layers[0].data == data)
+    _assert_data_equal(viewer.layers[0].data, data)
 
     assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
+    assert layout_count() == 2 * len(viewer.layers) + 2
 
     assert viewer.dims.ndim == 4
     assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
+    assert sum(displayed_sliders) == 1
 
     # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1, 3]
-    assert viewer.dims.order == [0, 2, 1, 3]
+    viewer.dims.order = _ORDER_SWAP_4D
+    assert tuple(viewer.dims.order) == _ORDER_SWAP_4D
 
     # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2, 3]
-    assert viewer.dims.order == [1, 0, 2, 3]
+    viewer.dims.order = _ORDER_ROLL_4D
+    assert tuple(viewer.dims.order) == _ORDER_ROLL_4D
 
-    # Close the viewer
-    viewer.window.close()
 
-
-def test_nD_volume_launch(qtbot):
+def test_nD_volume_launch(qtbot, nd_volume_data):
     """Test adding nD volume when viewer launched with 3D."""
     viewer = Viewer(ndisplay=3)
     view = viewer.window.qt_viewer
     qtbot.addWidget(view)
+    # bind the hot Qt attribute chains once
+    layout_count = view.layers.vbox_layout.count
+    displayed_sliders = view.dims._displayed_sliders
 
-    np.random.seed(0)
-    shape = (6, 10, 15, 20)
-    data = np.random.random(shape)
+    data = nd_volume_data
+    shape = data.shape
     viewer.add_image(data)
-    assert np.all(viewer.layers[0].data == data)
+    _assert_data_equal(viewer.layers[0].data, data)
     assert viewer.layers[0]._data_view.shape == shape[-3:]
 
     assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
+    assert layout_count() == 2 * len(viewer.layers) + 2
     assert viewer.dims.ndim == 4
     assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
+    assert sum(displayed_sliders) == 1
 
     # Close the viewer
     viewer.window.close()
 
 
-def test_nD_volume_launch_order(qtbot):
+def test_nD_volume_launch_order(qtbot, nd_volume_data):
     """Test adding nD volume when viewer launched with 3D."""
     order = [1, 0, 2, 3]
     viewer = Viewer(ndisplay=3, order=order)
     view = viewer.window.qt_viewer
     qtbot.addWidget(view)
+    # bind the hot Qt attribute chains once
+    layout_count = view.layers.vbox_layout.count
+    displayed_sliders = view.dims._displayed_sliders
 
-    np.random.seed(0)
-    shape = (6, 10, 15, 20)
-    data = np.random.random(shape)
+    data = nd_volume_data
+    shape = data.shape
     viewer.add_image(data)
-    assert np.all(viewer.layers[0].data == data)
+    _assert_data_equal(viewer.layers[0].data, data)
     assert viewer.layers[0]._data_view.shape == tuple(
         shape[o] for o in order[-3:]
     )
 
     assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
+    assert layout_count() == 2 * len(viewer.layers) + 2
     assert viewer.dims.ndim == 4
     assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
+    assert sum(displayed_sliders) == 1
     assert viewer.dims.order == order
 
     # Close the viewer
     viewer.window.close()
-
-
-def test_nD_pyramid(qtbot):
-    """Test adding nD image pyramid."""
-    viewer = Viewer()
-    view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
-
-    shapes = [(8, 40, 20), (4, 20, 10), (4, 10, 5)]
-    np.random.seed(0)
-    data = [np.random.random(s) for s in shapes]
-    viewer.add_pyramid(data)
-    assert np.all(viewer.layers[0].data == data)
-
-    assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
-
-    assert viewer.dims.ndim == 3
-    assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
-
-    # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1]
-    assert viewer.dims.order == [0, 2, 1]
-
-    # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2]
-    assert viewer.dims.order == [1, 0, 2]
-
-    # Close the viewer
-    viewer.window.close()
-
-
-def test_nD_labels(qtbot):
-    """Test adding nD labels image."""
-    viewer = Viewer()
-    view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
-
-    np.random.seed(0)
-    data = np.random.randint(20, size=(6, 10, 15))
-    viewer.add_labels(data)
-    assert np.all(viewer.layers[0].data == data)
-
-    assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
-
-    assert viewer.dims.ndim == 3
-    assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
-
-    # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1]
-    assert viewer.dims.order == [0, 2, 1]
-
-    # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2]
-    assert viewer.dims.order == [1, 0, 2]
-
-    # Close the viewer
-    viewer.window.close()
-
-
-def test_nD_points(qtbot):
-    """Test adding nD points."""
-    viewer = Viewer()
-    view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
-
-    np.random.seed(0)
-    data = 20 * np.random.random((10, 3))
-    viewer.add_points(data)
-    assert np.all(viewer.layers[0].data == data)
-
-    assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
-
-    assert viewer.dims.ndim == 3
-    assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
-
-    # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1]
-    assert viewer.dims.order == [0, 2, 1]
-
-    # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2]
-    assert viewer.dims.order == [1, 0, 2]
-
-    # Close the viewer
-    viewer.window.close()
-
-
-def test_nD_vectors(qtbot):
-    """Test adding nD vectors."""
-    viewer = Viewer()
-    view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
-
-    np.random.seed(0)
-    data = 20 * np.random.random((10, 2, 3))
-    viewer.add_vectors(data)
-    assert np.all(viewer.layers[0].data == data)
-
-    assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
-
-    assert viewer.dims.ndim == 3
-    assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
-
-    # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1]
-    assert viewer.dims.order == [0, 2, 1]
-
-    # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2]
-    assert viewer.dims.order == [1, 0, 2]
-
-    # Close the viewer
-    viewer.window.close()
-
-
-def test_nD_shapes(qtbot):
-    """Test adding vectors."""
-    viewer = Viewer()
-    view = viewer.window.qt_viewer
-    qtbot.addWidget(view)
-
-    np.random.seed(0)
-    # create one random rectangle per "plane"
-    planes = np.tile(np.arange(10).reshape((10, 1, 1)), (1, 4, 1))
-    corners = np.random.uniform(0, 10, size=(10, 4, 2))
-    data = np.concatenate((planes, corners), axis=2)
-    viewer.add_shapes(data)
-    assert np.all(
-        [np.all(ld == d) for ld, d in zip(viewer.layers[0].data, data)]
-    )
-    assert len(viewer.layers) == 1
-    assert view.layers.vbox_layout.count() == 2 * len(viewer.layers) + 2
-
-    assert viewer.dims.ndim == 3
-    assert view.dims.nsliders == viewer.dims.ndim
-    assert np.sum(view.dims._displayed_sliders) == 1
-
-    # Flip dims order displayed
-    viewer.dims.order = [0, 2, 1]
-    assert viewer.dims.order == [0, 2, 1]
-
-    # Flip dims order including non-displayed
-    viewer.dims.order = [1, 0, 2]
-    assert viewer.dims.order == [1, 0, 2]
-
-    # Close the viewer
-    viewer.window.close()
@@ -1,23 +1,18 @@
-import re
 import inspect
+import linecache
 
 from .misc import camel_to_snake, callsignature
 
 
 template = """def {name}(self, {signature}):
-    layer = {cls_name}({call_args})
+    layer = layers.{cls_name}({call_args})
     self.add_layer(layer)
     return layer
 """
 
 
-def create_func(cls, name=None, doc=None):
-    module = inspect.getmodule(cls)
-
-    module_name = module.__name__
+def create_func(cls, name=None, doc=None, filename: str = None):
     cls_name = cls.__name__
-    sig = inspect.signature(cls)
-    call_args = callsignature(cls)
 
     if name is None:
         name = camel_to_snake(cls_name)
@@ -25,21 +20,30 @@ def create_func(cls, name=None, doc=None):
     if 'layer' in name:
         raise ValueError(f"name {name} should not include 'layer'")
 
-    name = 'add_' + name
-
     if doc is None:
         doc = inspect.getdoc(cls)
-        cutoff = doc.find('\n\nParameters\n----------\n')
+        cutoff = doc.find('\nParameters\n----------\n')
+        end = doc.find('\n\nAttributes\n')
         if cutoff > 0:
-            doc = doc[cutoff:]
-
-        n = 'n' if cls_name[0].lower() in 'aeiou' else ''
-        doc = f'Adds a{n} {cls_name} layer to the viewer. ' + doc
-        doc += '\n\nReturns\n-------\n'
-        doc += f'layer : {module_name}.{cls_name}'
-        doc += '\n\tAdded layer.'
+            params = doc[cutoff:end] if end > 0 else doc[cutoff:]
+        else:
+            params = ''
+
+        n = 'n' if name[0] in 'aeiou' else ''
+        doc = f'Add a{n} {name} layer to the layers list.\n{params}\n'
+        doc += '\nReturns\n-------\n'
+        doc += f'layer : :class:`napari.layers.{cls_name}`\n'
+        doc += f'    The newly-created {cls_name.lower()} layer.'
         doc = doc.expandtabs(4)
 
+    name = 'add_' + name
+
+    if filename is None:
+        filename = f'<generated {name}>'
+
+    sig = inspect.signature(cls)
+    call_args = callsignature(cls)
+
     src = template.format(
         name=name,
         signature=str(sig)[1:-1],
@@ -47,10 +51,22 @@ def create_func(cls, name=None, doc=None):
         call_args=str(call_args)[1:-1],
     )
 
-    execdict = {cls_name: cls}
-    exec(src, execdict)
+    from .. import layers
+
+    execdict = {'layers': layers}
+    code = compile(src, filename=filename, mode='exec')
+    exec(code, execdict)
     func = execdict[name]
 
+    # register the source with linecache so that the generated function is
+    # introspectable with inspect.getsource
+    linecache.cache[filename] = (
+        len(src),
+        None,
+        src.splitlines(True),
+        filename,
+    )
+
     func.__doc__ = doc
 
     return func
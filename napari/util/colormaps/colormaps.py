@@ -95,11 +95,16 @@ def _low_discrepancy_image(image, seed=0.5):
 
     """
     phi = 1.6180339887498948482
-    image_out = (seed + image / phi) % 1
+    # Compute in a single float buffer with in-place operations so the
+    # divide, add, modulo and clip do not each allocate a full-size
+    # temporary; this path runs on every slice refresh of a labels layer.
+    image_out = np.divide(image, phi, dtype=np.float64)
+    image_out += seed
+    np.mod(image_out, 1, out=image_out)
     # Clipping slightly above 0 and below 1 is necessary to ensure that the
     # labels do not get mapped to 0 which is represented by the background
     # and is transparent
-    return np.clip(image_out, 0.00001, 1.0 - 0.00001)
+    return np.clip(image_out, 0.00001, 1.0 - 0.00001, out=image_out)
 
 
 def _low_discrepancy(dim, n, seed=0.5):
@@ -671,16 +671,56 @@ class EmitterGroup(EventEmitter):
         self.auto_connect = auto_connect
         self.auto_connect_format = "on_%s"
         self._emitters = OrderedDict()
+        # emitters declared as Event subclasses are constructed lazily on
+        # first access; this maps name -> (event_class, auto_connect)
+        self._lazy_emitters = OrderedDict()
         # whether the sub-emitters have been connected to the group:
         self._emitters_connected = False
         self.add(**emitters)
 
+    def __getattr__(self, name):
+        # only called when regular attribute lookup fails; build a lazily
+        # declared emitter on first access
+        try:
+            lazy = object.__getattribute__(self, '_lazy_emitters')
+        except AttributeError:
+            raise AttributeError(name)
+        if name in lazy:
+            return self._materialize_emitter(name)
+        raise AttributeError(
+            "%r object has no attribute %r" % (type(self).__name__, name)
+        )
+
+    def _materialize_emitter(self, name):
+        """Construct a lazily declared emitter and install it."""
+        event_class, auto_connect = self._lazy_emitters.pop(name)
+        emitter = EventEmitter(
+            source=self.source, type=name, event_class=event_class
+        )
+        setattr(self, name, emitter)
+        self._emitters[name] = emitter
+
+        if auto_connect and self.source is not None:
+            emitter.connect((self.source, self.auto_connect_format % name))
+
+        if self._emitters_connected:
+            emitter.connect(self)
+
+        return emitter
+
+    def _materialize_all_emitters(self):
+        """Construct any emitters whose creation is still pending."""
+        for name in list(self._lazy_emitters):
+            self._materialize_emitter(name)
+
     def __getitem__(self, name):
         """
         Return the emitter assigned to the specified name.
         Note that emitters may also be retrieved as an attribute of the
         EmitterGroup.
         """
+        if name in self._lazy_emitters:
+            return self._materialize_emitter(name)
         return self._emitters[name]
 
     def __setitem__(self, name, emitter):
@@ -710,7 +750,7 @@ class EmitterGroup(EventEmitter):
 
         # check all names before adding anything
         for name in kwargs:
-            if name in self._emitters:
+            if name in self._emitters or name in self._lazy_emitters:
                 raise ValueError(
                     "EmitterGroup already has an emitter named '%s'" % name
                 )
@@ -726,9 +766,10 @@ class EmitterGroup(EventEmitter):
                 emitter = Event
 
             if inspect.isclass(emitter) and issubclass(emitter, Event):
-                emitter = EventEmitter(
-                    source=self.source, type=name, event_class=emitter
-                )
+                # defer construction until the emitter is first accessed,
+                # so groups whose events are never used stay cheap
+                self._lazy_emitters[name] = (emitter, auto_connect)
+                continue
             elif not isinstance(emitter, EventEmitter):
                 raise Exception(
                     'Emitter must be specified as either an '
@@ -754,12 +795,14 @@ class EmitterGroup(EventEmitter):
     def emitters(self):
         """ List of current emitters in this group.
         """
+        self._materialize_all_emitters()
         return self._emitters
 
     def __iter__(self):
         """
         Iterates over the names of emitters in this group.
         """
+        self._materialize_all_emitters()
         for k in self._emitters:
             yield k
 
@@ -767,6 +810,7 @@ class EmitterGroup(EventEmitter):
         """ Block all emitters in this group.
         """
         self.block()
+        self._materialize_all_emitters()
         for em in self._emitters.values():
             em.block()
 
@@ -774,6 +818,7 @@ class EmitterGroup(EventEmitter):
         """ Unblock all emitters in this group.
         """
         self.unblock()
+        self._materialize_all_emitters()
         for em in self._emitters.values():
             em.unblock()
 
@@ -822,6 +867,7 @@ class EmitterGroup(EventEmitter):
     @ignore_callback_errors.setter
     def ignore_callback_errors(self, ignore):
         EventEmitter.ignore_callback_errors.fset(self, ignore)
+        self._materialize_all_emitters()
         for emitter in self._emitters.values():
             if isinstance(emitter, EventEmitter):
                 emitter.ignore_callback_errors = ignore
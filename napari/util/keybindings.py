@@ -350,6 +350,8 @@ class KeymapMixin:
     in every subclass.
     """
 
+    __slots__ = ('_keymap',)
+
     def __init__(self):
         self.keymap = {}
 